@@ -3,12 +3,10 @@
 
 # In[1]:
 
-# pip install pandas plotly kaleido
+# pip install pandas matplotlib openpyxl
 
 import pandas as pd
-import plotly.graph_objs as go
-import plotly.express as px
-import plotly.io as pio
+import matplotlib.pyplot as plt
 from openpyxl import Workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.styles import Font, Alignment
@@ -21,7 +19,13 @@ from typing import Any
 class TestAutomationAnalyzer:
     def __init__(self, csv_path: str):
         # Read and process CSV
-        self.df = pd.read_csv(csv_path)
+        # Only the Epic and result count columns are used here
+        count_columns = ['PASSED', 'FAILED', 'BROKEN', 'SKIPPED', 'UNKNOWN']
+        self.df = pd.read_csv(
+            csv_path,
+            usecols=['Epic'] + count_columns,
+            engine='c'
+        )
         self.consolidated_df = self._consolidate_epics()
 
     def _consolidate_epics(self) -> pd.DataFrame:
@@ -54,7 +58,7 @@ class TestAutomationAnalyzer:
         else:
             return 'Review Required'
 
-    def generate_epic_summary_table(self) -> go.Figure:
+    def generate_epic_summary_table(self) -> plt.Figure:
         # Add totals row
         totals = self.consolidated_df[['PASSED', 'FAILED', 'BROKEN', 'SKIPPED', 'UNKNOWN', 'totalTests']].sum()
         totals_row = pd.DataFrame({
@@ -71,48 +75,38 @@ class TestAutomationAnalyzer:
 
         final_df = pd.concat([self.consolidated_df, totals_row], ignore_index=True)
 
-        # Create interactive table with Plotly
-        fig = go.Figure(data=[go.Table(
-            header=dict(values=['Epic', 'Total Tests', 'Passed', 'Failed', 'Broken', 'Skipped', 'Pass Rate', 'Status'],
-                        fill_color='paleturquoise',
-                        align='center'),
-            cells=dict(values=[
-                final_df['Epic'],
-                final_df['totalTests'],
-                final_df['PASSED'],
-                final_df['FAILED'],
-                final_df['BROKEN'],
-                final_df['SKIPPED'],
-                final_df['passRate'].apply(lambda x: f'{x}%' if x != '' else ''),
-                final_df['status']
-            ],
-                fill_color=[
-                    'white',
-                    'white',
-                    'lightgreen',
-                    'lightcoral',
-                    'lightsalmon',
-                    'lightblue',
-                    'white',
-                    final_df['status'].apply(lambda x: 'lightgreen' if x == 'Acceptable' 
-                                              else 'yellow' if x == 'Maintenance Advised' 
-                                              else 'lightpink' if x == 'Review Required' else 'white')
-                ],
-                align='center')
-        )])
-
-        fig.update_layout(
-            title='Test Automation EPIC Summary',
-            height=4000,
-            width=1800
-        )
+        # Render the table with matplotlib; Plotly's static export needed a kaleido/Chromium subprocess per image
+        column_labels = ['Epic', 'Total Tests', 'Passed', 'Failed', 'Broken', 'Skipped', 'Pass Rate', 'Status']
+        columns = ['Epic', 'totalTests', 'PASSED', 'FAILED', 'BROKEN', 'SKIPPED', 'passRate', 'status']
+        table_data = final_df[columns].astype(str).values.tolist()
+        for row in table_data:
+            if row[6] != '':
+                row[6] = f'{row[6]}%'
+
+        column_colors = ['white', 'white', 'lightgreen', 'lightcoral', 'lightsalmon', 'lightblue', 'white']
+        status_colors = {
+            'Acceptable': 'lightgreen',
+            'Maintenance Advised': 'yellow',
+            'Review Required': 'lightpink'
+        }
+        cell_colors = [column_colors + [status_colors.get(status, 'white')] for status in final_df['status']]
+
+        fig, ax = plt.subplots(figsize=(18, max(4, 0.3 * len(table_data))))
+        ax.axis('off')
+        ax.set_title('Test Automation EPIC Summary')
+        table = ax.table(cellText=table_data, cellColours=cell_colors, colLabels=column_labels,
+                         colColours=['paleturquoise'] * len(column_labels), cellLoc='center', loc='center')
+        table.auto_set_font_size(False)
+        table.set_fontsize(9)
+        table.auto_set_column_width(list(range(len(column_labels))))
 
         return fig
 
     def save_epic_summary_table(self, output_path: str = 'epic_summary_table_ChatGPT_3.png'):
         # Save table as static image
         fig = self.generate_epic_summary_table()
-        pio.write_image(fig, output_path)
+        fig.savefig(output_path, bbox_inches='tight')
+        plt.close(fig)
         print(f"Table image saved to {output_path}")
 
     def save_epic_summary_to_excel(self, output_excel_path: str = 'epic_summary_ChatGPT_3.xlsx'):
@@ -1,4 +1,6 @@
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render off-screen; the table is only ever saved to file
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 from openpyxl import Workbook
@@ -102,7 +104,7 @@ class TestAutomationAnalyzer:
     
     def save_epic_summary_table_plot(self, output_path: str = 'epic_summary_table.png'):
         self.generate_epic_summary_table_plot()
-        plt.savefig(output_path, bbox_inches='tight')
+        plt.savefig(output_path, bbox_inches='tight', dpi=100)
         plt.close()
         print(f"Table image saved to {output_path}")
 
@@ -1,4 +1,6 @@
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render off-screen; the table is only ever saved to file
 import matplotlib.pyplot as plt
 from openpyxl import Workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
@@ -117,7 +119,7 @@ class TestAutomationAnalyzer:
             output_path = f'IH_Epic_Summary_Table_cf_v1-0_{date_suffix}.png'
         
         self.generate_epic_summary_table_plot()
-        plt.savefig(output_path, bbox_inches='tight')
+        plt.savefig(output_path, bbox_inches='tight', dpi=100)
         plt.close()
         print(f"Table image saved to {output_path}")
 
@@ -0,0 +1,238 @@
+import contextlib
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import xlsxwriter
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+# Result counts that make up an EPIC's total (UNKNOWN is deliberately left out of the totals)
+COUNT_COLUMNS = ['PASSED', 'FAILED', 'BROKEN', 'SKIPPED']
+
+# Status labels indexed by the codes produced in _classify_pass_rates, in report order
+STATUS_LABELS = np.array(['Acceptable', 'Maintenance Advised', 'Review Required'], dtype=object)
+
+# Table row colours by status code, with a trailing entry for rows without a status
+STATUS_COLOURS = np.array(['lightgreen', 'yellow', 'lightpink', 'white'], dtype=object)
+
+def _import_pyplot():
+    # pyplot is imported on first use so Excel-only runs skip matplotlib's start-up cost
+    import matplotlib.pyplot as plt
+    return plt
+
+def _link_or_copy(source_path: str, target_path: str):
+    # Hard link the target to the source so no bytes are rewritten. A new link is made under a
+    # temporary name and swapped in with os.replace, so the target switches to the new file in one
+    # step. Falls back to a plain copy whenever the link cannot be made (e.g. FAT or network drives,
+    # or a different volume), so the PowerBI file is always written.
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        # Already linked by an earlier run today. The source was rewritten in place (same inode), so
+        # the target was not swapped atomically: it was half-written while the workbook was saved.
+        return
+    temp_path = target_path + '.tmp'
+    # Clear a temp link left behind by an interrupted run, otherwise os.link fails with FileExistsError
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(temp_path)
+    try:
+        os.link(source_path, temp_path)
+    except OSError:
+        shutil.copyfile(source_path, target_path)
+        return
+    try:
+        os.replace(temp_path, target_path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+class TestAutomationAnalyzer:
+    def __init__(self, csv_path: str):
+        print("Reading CSV file...")
+        # Taken once so the PNG and Excel outputs of a run always share the same date
+        self._date_suffix = datetime.now().strftime('%d%m%y')
+        # Parse with Arrow's multi-threaded CSV reader and hand pandas the columnar result.
+        # Empty strings are read as nulls to match pandas' read_csv handling of blank tags.
+        table = pv.read_csv(
+            csv_path,
+            read_options=pv.ReadOptions(use_threads=True, block_size=1 << 20),
+            convert_options=pv.ConvertOptions(
+                include_columns=['Epic', 'Feature', 'Story'] + COUNT_COLUMNS,
+                strings_can_be_null=True,
+                # Per-test-case counts are small, so int32 halves what the groupby has to move
+                column_types={col: pa.int32() for col in COUNT_COLUMNS}
+            )
+        )
+        self.df = table.to_pandas()
+        self.consolidated_df = self._consolidate_epics()
+        print("CSV file read and data consolidated.")
+
+    def _consolidate_epics(self) -> pd.DataFrame:
+        # Work out each row's reporting group up front so a single groupby covers all three cases:
+        #  - rows with an Epic are grouped by Epic
+        #  - rows with no Epic/Feature but a Story are grouped by Story, with a suffix
+        #  - completely untagged rows (no Epic, Feature, or Story) share one bucket
+        # Rows with a Feature but no Epic keep a missing key and are dropped by the groupby.
+        no_epic_or_feature = self.df['Epic'].isna() & self.df['Feature'].isna()
+        story_key = (self.df['Story'] + ' - No EPIC Tagged').where(no_epic_or_feature)
+        group_key = self.df['Epic'].where(self.df['Epic'].notna(), story_key)
+        untagged = no_epic_or_feature & self.df['Story'].isna()
+        group_key = group_key.mask(untagged, 'Test Cases Not Tagged')
+
+        # Grouping on the case as well keeps EPICs ahead of story-only rows and the untagged bucket
+        group_case = no_epic_or_feature.astype('int8') + untagged
+        consolidated = (
+            self.df.groupby([group_case.rename('case'), group_key.rename('Epic')])[COUNT_COLUMNS]
+            .sum()
+            .reset_index(level='case', drop=True)
+            .reset_index()
+        )
+
+        # Calculate metrics
+        counts = consolidated[COUNT_COLUMNS].to_numpy(dtype=np.int64, copy=False)
+        total = counts.sum(axis=1)
+        rate, status_codes = self._classify_pass_rates(counts[:, 0], total)
+        consolidated['totalTests'] = total
+        consolidated['passRate'] = rate
+        consolidated['status'] = pd.Categorical.from_codes(status_codes, categories=STATUS_LABELS, ordered=True)
+        
+        # Modified sorting to order by status (category order, so an int8 code sort) and then by passRate in descending order
+        consolidated.sort_values(
+            by=['status', 'passRate'], 
+            ascending=[True, False], 
+            inplace=True
+        )
+
+        return consolidated
+
+    @staticmethod
+    def _classify_pass_rates(passed: np.ndarray, total: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rate = np.round(passed / total * 100, 2)
+        # 0 = Acceptable (>= 95%), 1 = Maintenance Advised (>= 80%), 2 = Review Required (lower, or no tests)
+        status_codes = (2 - (rate >= 80) - (rate >= 95)).astype(np.int8)
+        return rate, status_codes
+
+    @cached_property
+    def final_df(self) -> pd.DataFrame:
+        # Consolidated EPIC rows followed by a single TOTAL row, built on first use and shared by the PNG and Excel outputs
+        consolidated = self.consolidated_df
+        total_columns = COUNT_COLUMNS + ['totalTests']
+        column_sums = consolidated[total_columns].to_numpy(dtype=np.int64).sum(axis=0)
+
+        # Each column is built at its final length with the TOTAL value appended, which keeps the
+        # integer and categorical dtypes intact; the TOTAL row has no passRate or status
+        totals = {col: np.append(consolidated[col].to_numpy(), col_sum) for col, col_sum in zip(total_columns, column_sums)}
+        return pd.DataFrame({
+            'Epic': np.append(consolidated['Epic'].to_numpy(dtype=object), 'TOTAL'),
+            **totals,
+            'passRate': np.append(consolidated['passRate'].to_numpy(), np.nan),
+            'status': pd.Categorical.from_codes(
+                np.append(consolidated['status'].cat.codes.to_numpy(), -1),
+                dtype=consolidated['status'].dtype
+            )
+        })
+
+    def generate_epic_summary_table_plot(self) -> Any:
+        print("Generating table plot...")
+        plt = _import_pyplot()
+
+        final_df = self.final_df
+
+        column_labels = ['Epic', 'Passed', 'Failed', 'Broken', 'Skipped', 'Total Tests', 'Pass Rate %', 'Status']
+        if len(final_df.columns) != len(column_labels):
+            raise ValueError("Mismatch between DataFrame columns and column labels")
+
+        # Format every column to text in one pass rather than boxing each value into a nested list
+        table_data = final_df.astype('string').fillna('').to_numpy()
+
+        # Color cells based on status code; the TOTAL row has no status (code -1) and stays white
+        status_codes = final_df['status'].cat.codes.to_numpy()
+        row_colours = STATUS_COLOURS[np.where(status_codes < 0, len(STATUS_COLOURS) - 1, status_codes)]
+        cell_colours = np.broadcast_to(row_colours[:, None], (len(final_df), len(column_labels))).tolist()
+
+        # Calculate widths for Epic and Status columns based on content
+        max_epic_length = max(len(str(x)) for x in final_df['Epic'])
+        max_status_length = max(len(str(x)) for x in final_df['status'])
+        
+        # Dynamic width calculation with bounds
+        epic_width = min(0.5, max(0.3, max_epic_length * 0.004))  # Epic column
+        status_width = min(0.25, max(0.05, max_status_length * 0.005))  # Status column
+
+        # Distribute remaining width among other columns
+        remaining_width = 1.0 - (epic_width + status_width)
+        middle_cols_width = remaining_width / (len(column_labels) - 2)  # -2 for Epic and Status
+        col_widths = [epic_width] + [middle_cols_width] * (len(column_labels) - 2) + [status_width]
+
+        # Size the figure to the table and let the table fill it, so the saved image needs no
+        # bbox_inches='tight' re-render to trim the margins. Sizes (in inches) follow the old layout:
+        #  - table width: the default axes width (0.775) of the previous 24in-wide figure
+        #  - row height: matplotlib sizes table rows from Table.FONTSIZE (10pt) with 1.2 line spacing,
+        #    and the old table.scale(1.2, 1.2) added another 1.2 (the later 9pt font does not change it)
+        #  - margin: savefig's default pad_inches, which the tight crop used to leave around the table
+        margin = 0.1
+        fig_width = 0.775 * 24 + 2 * margin
+        row_height = 10 / 72 * 1.2 * 1.2
+        fig_height = row_height * (len(table_data) + 1) + 2 * margin
+        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
+        fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+        ax.axis('off')
+
+        # Create table with processed data; widths are applied as the cells are built
+        table_bbox = [margin / fig_width, margin / fig_height, 1 - 2 * margin / fig_width, 1 - 2 * margin / fig_height]
+        table = ax.table(cellText=table_data, cellColours=cell_colours, colLabels=column_labels,
+                         colWidths=col_widths, cellLoc='center', bbox=table_bbox, edges='closed')
+        table.auto_set_font_size(False)
+        table.set_fontsize(9)
+
+        # Header formatting; cellLoc/colLoc already centre every cell's text, so only the header row is touched
+        cells = table.get_celld()
+        for col in range(len(column_labels)):
+            cell = cells[(0, col)]
+            cell.set(fontsize=10, facecolor='paleturquoise')
+            cell.set_text_props(fontweight='bold')
+
+        print("Table plot generated.")
+        return fig
+
+    def save_epic_summary_table_plot(self, output_path: str = None):
+        if output_path is None:
+            output_path = f'IH_Epic_Summary_Table_cf_v1-0_{self._date_suffix}.png'
+        
+        plt = _import_pyplot()
+        fig = self.generate_epic_summary_table_plot()
+        fig.savefig(output_path, dpi=100)
+        plt.close(fig)
+        print(f"Table image saved to {output_path}")
+
+    def save_epic_summary_to_excel(self, output_excel_path: str = None):
+        if output_excel_path is None:
+            output_excel_path = f'IH_Epic_Summary_XL_cf_v1-0_{self._date_suffix}.xlsx'
+
+        self._write_excel_workbook(output_excel_path)
+        print(f"Excel file saved to {output_excel_path}")
+
+        # Save XL file out to another EXCEL file with a name that does not change based on date
+        # This will be the standard approach for a PowerBI report to read from
+        sPBI_Report_Source_Path = 'IH_Epic_ALLURE_Summary_cf_2025.xlsx'   
+        # The contents are identical, so link to the finished file rather than serializing (and compressing) it again
+        _link_or_copy(output_excel_path, sPBI_Report_Source_Path)
+        print(f"Excel file (for PowerBI use) saved to {sPBI_Report_Source_Path}")
+
+    def _write_excel_workbook(self, output_excel_path: str):
+        final_df = self.final_df
+
+        # constant_memory flushes each row as soon as the next one starts, so rows must be written top-down
+        wb = xlsxwriter.Workbook(output_excel_path, {'constant_memory': True, 'strings_to_numbers': False})
+        ws = wb.add_worksheet("EPIC Summary")
+        header_format = wb.add_format({'bold': True, 'align': 'center'})
+
+        ws.write_row(0, 0, list(final_df.columns), header_format)
+        # Missing values (the TOTAL row's passRate and status) are written as blank cells
+        rows = final_df.astype(object).where(final_df.notna(), None)
+        for r_idx, row in enumerate(rows.itertuples(index=False, name=None), 1):
+            ws.write_row(r_idx, 0, row)
+
+        wb.close()